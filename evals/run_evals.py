@@ -13,13 +13,17 @@ Exit codes:
     1 - One or more evals fail
 """
 
+import ast
 import difflib
+import functools
 import json
+import os
 import re
 import sys
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -32,18 +36,76 @@ GOLDENS_DIR = SCRIPT_DIR / "goldens"
 FIXTURES_DIR = SCRIPT_DIR / "fixtures"
 PLUGIN_DIR = "plugin"
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+_RE_CLAUDE_HOOKS_ALLOWLISTS = re.compile(r"\.claude/(hooks|allowlists)")
+# Frontmatter lines mentioning both command: and CLAUDE_PLUGIN_ROOT, in either order
+_RE_HOOK_COMMAND_LINE = re.compile(
+    r"^.*(?:command:.*CLAUDE_PLUGIN_ROOT|CLAUDE_PLUGIN_ROOT.*command:).*$", re.MULTILINE
+)
+_RE_EXPECTED_QUOTE = re.compile(r'"\$\{CLAUDE_PLUGIN_ROOT\}/(?:hooks|allowlists)/[^"]*"')
+_RE_NAME_FIELD = re.compile(r"^name:\s*(.+)$", re.MULTILINE)
+_RE_ALLOWLIST_REF = re.compile(r"allowlists/(\S+\.regex)")
+_RE_NETWORK = re.compile("|".join([
+    r"\brequests\.",
+    r"\burllib\.",
+    r"\bhttp\.client",
+    r"\bhttp\.server",
+    r"\bsocket\.",
+    r"\bhttpx\.",
+    r"\baiohttp\.",
+]))
+_RE_PUBLIC_EXPORT = re.compile(r"^(?:def|class)\s+([A-Za-z_][A-Za-z0-9_]*)")
+_RE_TEST_FUNC = re.compile(r"^\s+def\s+(test_[A-Za-z0-9_]+)")
+
+PatternLike = Union[str, "re.Pattern[str]"]
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _load_goldens() -> Dict[str, object]:
+    """Parse every golden JSON file in evals/goldens/ once.
+
+    A file that fails to parse maps to its exception, which load_golden
+    re-raises so only the evals using that golden fail.
+    """
+    goldens: Dict[str, object] = {}
+    if not GOLDENS_DIR.is_dir():
+        return goldens
+    for path in sorted(GOLDENS_DIR.iterdir()):
+        if path.suffix != ".json":
+            continue
+        try:
+            goldens[path.name] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            goldens[path.name] = e
+    return goldens
+
+
+GOLDENS = _load_goldens()
+
+
 def load_golden(name: str) -> dict:
-    """Load a golden JSON file from evals/goldens/."""
-    path = GOLDENS_DIR / name
-    with open(path) as f:
-        return json.load(f)
+    """Return a preloaded golden from evals/goldens/ (shared; callers must not mutate)."""
+    if name not in GOLDENS:
+        raise FileNotFoundError(f"golden file not found: {GOLDENS_DIR / name}")
+    golden = GOLDENS[name]
+    if isinstance(golden, Exception):
+        raise golden
+    return golden
+
 
+@functools.lru_cache(maxsize=None)
+def golden_set(name: str, key: str) -> FrozenSet[str]:
+    """Frozen set of a golden's list (or dict keys) under ``key``, built once."""
+    return frozenset(load_golden(name)[key])
 
+
+@functools.lru_cache(maxsize=None)
 def read_file(rel_path: str) -> str:
     """Read a file relative to repo root. Returns content or empty string if missing."""
     full = REPO_ROOT / rel_path
@@ -52,15 +114,30 @@ def read_file(rel_path: str) -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=None)
+def read_lines(rel_path: str) -> Tuple[str, ...]:
+    """read_file split into lines (cached; shared by all callers)."""
+    return tuple(read_file(rel_path).splitlines())
+
+
+@functools.lru_cache(maxsize=None)
+def _list_dir(rel_dir: str) -> Tuple[str, ...]:
+    """Filenames directly inside a directory relative to repo root, unordered (cached)."""
+    try:
+        with os.scandir(REPO_ROOT / rel_dir) as it:
+            return tuple(entry.name for entry in it if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+
+
 def list_files(rel_dir: str, suffix: str = "") -> List[str]:
     """List filenames in a directory relative to repo root, optionally filtered by suffix."""
-    full = REPO_ROOT / rel_dir
-    if not full.is_dir():
-        return []
-    files = [f.name for f in full.iterdir() if f.is_file()]
-    if suffix:
-        files = [f for f in files if f.endswith(suffix)]
-    return sorted(files)
+    return sorted(f for f in _list_dir(rel_dir) if f.endswith(suffix))
+
+
+def list_files_set(rel_dir: str, suffix: str = "") -> FrozenSet[str]:
+    """Unordered list_files for callers that only compare membership."""
+    return frozenset(f for f in _list_dir(rel_dir) if f.endswith(suffix))
 
 
 def dir_exists(rel_path: str) -> bool:
@@ -71,36 +148,114 @@ def file_exists(rel_path: str) -> bool:
     return (REPO_ROOT / rel_path).is_file()
 
 
-def grep_dir(rel_dir: str, pattern: str, file_suffix: str = "") -> List[Tuple[str, int, str]]:
-    """Search files in a directory for a regex pattern. Returns list of (filename, lineno, line)."""
-    results = []
-    compiled = re.compile(pattern)
+def _walk_files(top: str, file_suffix: str = "") -> Iterator[str]:
+    """Yield paths of regular files under top ending in file_suffix (unordered)."""
+    stack = [top]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and entry.name.endswith(file_suffix):
+                    yield entry.path
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_tree(rel_dir: str, file_suffix: str = "") -> Tuple[Tuple[str, str, Tuple[str, ...]], ...]:
+    """Read every file under a directory once. Returns sorted ((rel_path, text, lines), ...).
+
+    ``text`` is ``"\\n".join(lines)``, so its line boundaries are exactly the
+    ones the per-line searches see.
+    """
     full = REPO_ROOT / rel_dir
     if not full.is_dir():
-        return results
-    for fpath in sorted(full.rglob("*")):
-        if not fpath.is_file():
-            continue
-        if file_suffix and not fpath.name.endswith(file_suffix):
-            continue
+        return ()
+    snapshot = []
+    for fpath in _walk_files(str(full), file_suffix):
         try:
-            lines = fpath.read_text(encoding="utf-8", errors="replace").splitlines()
+            lines = tuple(Path(fpath).read_text(encoding="utf-8", errors="replace").splitlines())
         except Exception:
             continue
+        snapshot.append((os.path.relpath(fpath, REPO_ROOT), "\n".join(lines), lines))
+    snapshot.sort()
+    return tuple(snapshot)
+
+
+def _as_regex(pattern: PatternLike) -> "re.Pattern[str]":
+    return pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+
+
+# Constructs whose meaning changes when a line is searched inside the whole text
+_LINE_ONLY_SYNTAX = ("\\A", "\\Z", "(?!", "(?<!")
+
+
+@functools.lru_cache(maxsize=None)
+def _whole_text(regex: "re.Pattern[str]") -> Optional["re.Pattern[str]"]:
+    """MULTILINE twin of a line regex, used to reject a whole file in one search.
+
+    Searched against the newline-joined lines of a file: if any line matches
+    ``regex`` the joined text matches the twin, so a miss skips the file.
+    Returns None for patterns where that does not hold.
+    """
+    if any(syntax in regex.pattern for syntax in _LINE_ONLY_SYNTAX):
+        return None
+    return re.compile(regex.pattern, regex.flags | re.MULTILINE)
+
+
+def grep_dir(rel_dir: str, pattern: PatternLike, file_suffix: str = "") -> List[Tuple[str, int, str]]:
+    """Search files in a directory for a regex pattern. Returns list of (filename, lineno, line)."""
+    results = []
+    compiled = _as_regex(pattern)
+    prescreen = _whole_text(compiled)
+    for rel_path, text, lines in _scan_tree(rel_dir, file_suffix):
+        if prescreen is not None and not prescreen.search(text):
+            continue
         for i, line in enumerate(lines, 1):
             if compiled.search(line):
-                results.append((str(fpath.relative_to(REPO_ROOT)), i, line.strip()))
+                results.append((rel_path, i, line.strip()))
+    return results
+
+
+def any_match_dir(rel_dir: str, pattern: PatternLike, file_suffix: str = "") -> bool:
+    """Return True if any line in the directory matches; stops at the first hit."""
+    compiled = _as_regex(pattern)
+    prescreen = _whole_text(compiled)
+    for _, text, lines in _scan_tree(rel_dir, file_suffix):
+        if prescreen is not None and not prescreen.search(text):
+            continue
+        if any(compiled.search(line) for line in lines):
+            return True
+    return False
+
+
+def find_dir(rel_dir: str, needle: str, file_suffix: str = "") -> List[Tuple[str, int, str]]:
+    """grep_dir for a literal substring; avoids the regex engine for fixed strings."""
+    results = []
+    for rel_path, text, lines in _scan_tree(rel_dir, file_suffix):
+        if needle not in text:
+            continue
+        for i, line in enumerate(lines, 1):
+            if needle in line:
+                results.append((rel_path, i, line.strip()))
     return results
 
 
-def grep_file(rel_path: str, pattern: str) -> List[Tuple[int, str]]:
+def find_file(rel_path: str, needle: str) -> List[Tuple[int, str]]:
+    """grep_file for a literal substring."""
+    if needle not in read_file(rel_path):
+        return []
+    return [
+        (i, line.strip())
+        for i, line in enumerate(read_lines(rel_path), 1)
+        if needle in line
+    ]
+
+
+def grep_file(rel_path: str, pattern: PatternLike) -> List[Tuple[int, str]]:
     """Search a single file for a regex pattern. Returns list of (lineno, line)."""
     results = []
-    content = read_file(rel_path)
-    if not content:
-        return results
-    compiled = re.compile(pattern)
-    for i, line in enumerate(content.splitlines(), 1):
+    compiled = _as_regex(pattern)
+    for i, line in enumerate(read_lines(rel_path), 1):
         if compiled.search(line):
             results.append((i, line.strip()))
     return results
@@ -121,6 +276,12 @@ def extract_frontmatter(content: str) -> Optional[str]:
     return "\n".join(lines[1:end])
 
 
+@functools.lru_cache(maxsize=None)
+def agent_frontmatter(filename: str) -> Optional[str]:
+    """Frontmatter of plugin/agents/<filename>, or None. Shared by the path/orc evals."""
+    return extract_frontmatter(read_file(f"{PLUGIN_DIR}/agents/{filename}"))
+
+
 # ---------------------------------------------------------------------------
 # Result tracking
 # ---------------------------------------------------------------------------
@@ -153,7 +314,7 @@ def record(eval_id: str, description: str, passed: bool, message: str = ""):
 
 def eval_path_001():
     """EVAL-PATH-001: Zero CLAUDE_PROJECT_DIR occurrences in agents/"""
-    hits = grep_dir(f"{PLUGIN_DIR}/agents", r"CLAUDE_PROJECT_DIR")
+    hits = find_dir(f"{PLUGIN_DIR}/agents", "CLAUDE_PROJECT_DIR")
     record(
         "EVAL-PATH-001",
         "Zero CLAUDE_PROJECT_DIR occurrences in agents/",
@@ -164,7 +325,10 @@ def eval_path_001():
 
 def eval_path_002():
     """EVAL-PATH-002: Zero .claude/hooks or .claude/allowlists paths in agents/"""
-    hits = grep_dir(f"{PLUGIN_DIR}/agents", r"\.claude/(hooks|allowlists)")
+    agents_dir = f"{PLUGIN_DIR}/agents"
+    hits = []
+    if any_match_dir(agents_dir, _RE_CLAUDE_HOOKS_ALLOWLISTS):
+        hits = grep_dir(agents_dir, _RE_CLAUDE_HOOKS_ALLOWLISTS)
     record(
         "EVAL-PATH-002",
         "Zero .claude/(hooks|allowlists) paths in agents/",
@@ -178,8 +342,7 @@ def eval_path_003():
     golden = load_golden("agent_inventory.json")
     missing = []
     for filename in golden["agents"]:
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content)
+        fm = agent_frontmatter(filename)
         if fm is None:
             missing.append(f"{filename}: no frontmatter")
             continue
@@ -203,8 +366,7 @@ def eval_path_004():
     missing = []
     for agent_name, allowlist_file in golden["bindings"].items():
         filename = f"{agent_name}.md"
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content)
+        fm = agent_frontmatter(filename)
         if fm is None:
             missing.append(f"{filename}: no frontmatter")
             continue
@@ -214,8 +376,7 @@ def eval_path_004():
     # Agents without allowlist should NOT have allowlist references
     for agent_name in golden["agents_without_allowlist"]:
         filename = f"{agent_name}.md"
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content) or ""
+        fm = agent_frontmatter(filename) or ""
         if "allowlists/" in fm:
             missing.append(f"{filename}: should not reference allowlists/ but does")
     record(
@@ -231,19 +392,17 @@ def eval_path_005():
     # Pattern: '...  "${CLAUDE_PLUGIN_ROOT}/hooks/...'  (double quote around variable+path)
     golden = load_golden("agent_inventory.json")
     bad_quoting = []
-    expected_pattern = re.compile(r'"\$\{CLAUDE_PLUGIN_ROOT\}/(?:hooks|allowlists)/[^"]*"')
     for filename in golden["agents"]:
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content)
+        fm = agent_frontmatter(filename)
         if fm is None:
             continue
-        for line in fm.splitlines():
-            if "CLAUDE_PLUGIN_ROOT" in line and "command:" in line:
-                # Check that the variable is properly wrapped in braces and double-quoted
-                if "${CLAUDE_PLUGIN_ROOT}" not in line:
-                    bad_quoting.append(f"{filename}: missing braces in CLAUDE_PLUGIN_ROOT")
-                elif not expected_pattern.search(line):
-                    bad_quoting.append(f"{filename}: unexpected quoting: {line.strip()}")
+        for m in _RE_HOOK_COMMAND_LINE.finditer(fm):
+            line = m.group(0)
+            # Check that the variable is properly wrapped in braces and double-quoted
+            if "${CLAUDE_PLUGIN_ROOT}" not in line:
+                bad_quoting.append(f"{filename}: missing braces in CLAUDE_PLUGIN_ROOT")
+            elif not _RE_EXPECTED_QUOTE.search(line):
+                bad_quoting.append(f"{filename}: unexpected quoting: {line.strip()}")
     record(
         "EVAL-PATH-005",
         'Hook command quoting uses "${CLAUDE_PLUGIN_ROOT}/..." pattern',
@@ -255,14 +414,14 @@ def eval_path_005():
 def eval_inv_001():
     """EVAL-INV-001: Exactly 13 named agent .md files in agents/"""
     golden = load_golden("agent_inventory.json")
-    expected = set(golden["agents"].keys())
-    actual = set(list_files(f"{PLUGIN_DIR}/agents", ".md"))
+    expected = golden_set("agent_inventory.json", "agents")
+    actual = list_files_set(f"{PLUGIN_DIR}/agents", ".md")
     missing = expected - actual
     extra = actual - expected
     record(
         "EVAL-INV-001",
         f"Exactly {golden['expected_count']} agent .md files in agents/",
-        missing == set() and extra == set() and len(actual) == golden["expected_count"],
+        not missing and not extra and len(actual) == golden["expected_count"],
         f"missing={sorted(missing)}, extra={sorted(extra)}, count={len(actual)}"
         if missing or extra or len(actual) != golden["expected_count"]
         else "",
@@ -283,10 +442,10 @@ def eval_inv_002():
 def eval_inv_003():
     """EVAL-INV-003: Correct hook file counts in hooks/"""
     golden = load_golden("hook_inventory.json")
-    actual_py = set(list_files(f"{PLUGIN_DIR}/hooks", ".py"))
-    actual_regex = set(list_files(f"{PLUGIN_DIR}/hooks", ".regex"))
-    expected_py = set(golden["python_files"])
-    expected_regex = set(golden["regex_files"])
+    actual_py = list_files_set(f"{PLUGIN_DIR}/hooks", ".py")
+    actual_regex = list_files_set(f"{PLUGIN_DIR}/hooks", ".regex")
+    expected_py = golden_set("hook_inventory.json", "python_files")
+    expected_regex = golden_set("hook_inventory.json", "regex_files")
     missing_py = expected_py - actual_py
     extra_py = actual_py - expected_py
     missing_regex = expected_regex - actual_regex
@@ -319,8 +478,8 @@ def eval_inv_003():
 def eval_inv_004():
     """EVAL-INV-004: Correct allowlist file count in allowlists/"""
     golden = load_golden("allowlist_inventory.json")
-    actual = set(list_files(f"{PLUGIN_DIR}/allowlists", ".regex"))
-    expected = set(golden["files"])
+    actual = list_files_set(f"{PLUGIN_DIR}/allowlists", ".regex")
+    expected = golden_set("allowlist_inventory.json", "files")
     missing = expected - actual
     extra = actual - expected
     record(
@@ -489,7 +648,7 @@ def eval_tpl_002():
     """EVAL-TPL-002: No .claude/agents/ path in CLAUDE.md or template"""
     errors = []
     for path in ["CLAUDE.md", f"{PLUGIN_DIR}/skills/init/SKILL.md"]:
-        hits = grep_file(path, r"\.claude/agents/")
+        hits = find_file(path, ".claude/agents/")
         if hits:
             errors.append(f"{path}: {len(hits)} occurrence(s) at line(s) {[h[0] for h in hits]}")
     record(
@@ -518,12 +677,11 @@ def eval_tpl_003():
 
 def eval_orc_001():
     """EVAL-ORC-001: Delegation map names match agent filenames"""
-    golden = load_golden("delegation_map.json")
-    agent_files = list_files(f"{PLUGIN_DIR}/agents", ".md")
-    agent_names_from_files = sorted(f.replace(".md", "") for f in agent_files)
-    delegation_names = sorted(golden["delegation_order"])
-    missing_in_files = set(delegation_names) - set(agent_names_from_files)
-    missing_in_map = set(agent_names_from_files) - set(delegation_names)
+    agent_files = list_files_set(f"{PLUGIN_DIR}/agents", ".md")
+    agent_names_from_files = {f.replace(".md", "") for f in agent_files}
+    delegation_names = golden_set("delegation_map.json", "delegation_order")
+    missing_in_files = delegation_names - agent_names_from_files
+    missing_in_map = agent_names_from_files - delegation_names
     errors = []
     if missing_in_files:
         errors.append(f"In delegation map but no file: {sorted(missing_in_files)}")
@@ -542,13 +700,12 @@ def eval_orc_002():
     golden = load_golden("agent_inventory.json")
     errors = []
     for filename, expected_name in golden["agents"].items():
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content)
+        fm = agent_frontmatter(filename)
         if fm is None:
             errors.append(f"{filename}: no frontmatter found")
             continue
         # Find name: field
-        name_match = re.search(r"^name:\s*(.+)$", fm, re.MULTILINE)
+        name_match = _RE_NAME_FIELD.search(fm)
         if not name_match:
             errors.append(f"{filename}: no 'name:' field in frontmatter")
         else:
@@ -569,14 +726,12 @@ def eval_orc_003():
     errors = []
     for agent_name, expected_allowlist in golden["bindings"].items():
         filename = f"{agent_name}.md"
-        content = read_file(f"{PLUGIN_DIR}/agents/{filename}")
-        fm = extract_frontmatter(content)
+        fm = agent_frontmatter(filename)
         if fm is None:
             errors.append(f"{filename}: no frontmatter")
             continue
         # Look for the allowlist reference
-        pattern = r"allowlists/(\S+\.regex)"
-        matches = re.findall(pattern, fm)
+        matches = _RE_ALLOWLIST_REF.findall(fm)
         # Remove trailing quote marks from matches
         matches = [m.rstrip('"\'') for m in matches]
         if expected_allowlist not in matches:
@@ -616,7 +771,7 @@ def eval_cln_001():
 
 def eval_cln_002():
     """EVAL-CLN-002: No .system2/ entries in .gitignore"""
-    hits = grep_file(".gitignore", r"\.system2/")
+    hits = find_file(".gitignore", ".system2/")
     record(
         "EVAL-CLN-002",
         "No .system2/ entries in .gitignore",
@@ -627,7 +782,7 @@ def eval_cln_002():
 
 def eval_cln_003():
     """EVAL-CLN-003: spec*/ pattern in .gitignore"""
-    hits = grep_file(".gitignore", r"spec\*/")
+    hits = find_file(".gitignore", "spec*/")
     record(
         "EVAL-CLN-003",
         "spec*/ pattern preserved in .gitignore",
@@ -703,32 +858,39 @@ def eval_doc_002():
     )
 
 
+# Modules hook scripts may import, matched on the top-level name (so
+# importlib.util is covered by importlib). Deliberately an allowlist rather
+# than all of the stdlib: network modules such as socket must stay out.
+STDLIB_MODULES = frozenset({
+    "sys", "os", "re", "json", "shutil", "subprocess", "argparse",
+    "typing", "__future__", "_hook_utils", "pathlib", "importlib",
+    "textwrap", "collections", "functools",
+    "io", "string", "hashlib", "time", "datetime", "copy",
+    "traceback", "contextlib", "abc", "enum", "dataclasses",
+    "shlex", "glob", "fnmatch", "signal", "struct", "tempfile",
+    "unittest", "logging", "inspect", "ast", "token", "tokenize",
+})
+
+
 def eval_sec_001():
     """EVAL-SEC-001: No non-stdlib imports in hook scripts"""
-    stdlib_modules = {
-        "sys", "os", "re", "json", "shutil", "subprocess", "argparse",
-        "typing", "__future__", "_hook_utils", "pathlib", "importlib",
-        "importlib.util", "textwrap", "collections", "functools",
-        "io", "string", "hashlib", "time", "datetime", "copy",
-        "traceback", "contextlib", "abc", "enum", "dataclasses",
-        "shlex", "glob", "fnmatch", "signal", "struct", "tempfile",
-        "unittest", "logging", "inspect", "ast", "token", "tokenize",
-    }
     errors = []
-    hook_dir = REPO_ROOT / PLUGIN_DIR / "hooks"
-    if hook_dir.is_dir():
-        for fpath in sorted(hook_dir.glob("*.py")):
-            lines = fpath.read_text(encoding="utf-8").splitlines()
-            for i, line in enumerate(lines, 1):
-                stripped = line.strip()
-                if stripped.startswith("import ") or stripped.startswith("from "):
-                    # Parse the module name
-                    if stripped.startswith("from "):
-                        module = stripped.split()[1].split(".")[0]
-                    else:
-                        module = stripped.split()[1].split(".")[0].rstrip(",")
-                    if module not in stdlib_modules:
-                        errors.append(f"{fpath.name}:{i}: non-stdlib import: {stripped}")
+    for fname in list_files(f"{PLUGIN_DIR}/hooks", ".py"):
+        try:
+            tree = ast.parse(read_file(f"{PLUGIN_DIR}/hooks/{fname}"), filename=fname)
+        except SyntaxError as e:
+            errors.append(f"{fname}: could not parse: {e}")
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0:
+                modules = [node.module or ""]
+            else:
+                continue
+            for module in modules:
+                if module.split(".")[0] not in STDLIB_MODULES:
+                    errors.append(f"{fname}:{node.lineno}: non-stdlib import: {module}")
     record(
         "EVAL-SEC-001",
         "No non-stdlib imports in hook scripts",
@@ -739,17 +901,10 @@ def eval_sec_001():
 
 def eval_sec_002():
     """EVAL-SEC-002: No network calls in hook scripts"""
-    network_patterns = [
-        r"\brequests\.",
-        r"\burllib\.",
-        r"\bhttp\.client",
-        r"\bhttp\.server",
-        r"\bsocket\.",
-        r"\bhttpx\.",
-        r"\baiohttp\.",
-    ]
-    combined = "|".join(network_patterns)
-    hits = grep_dir(f"{PLUGIN_DIR}/hooks", combined, file_suffix=".py")
+    hooks_dir = f"{PLUGIN_DIR}/hooks"
+    hits = []
+    if any_match_dir(hooks_dir, _RE_NETWORK, file_suffix=".py"):
+        hits = grep_dir(hooks_dir, _RE_NETWORK, file_suffix=".py")
     record(
         "EVAL-SEC-002",
         "No network calls in hook scripts",
@@ -776,12 +931,11 @@ def eval_sec_003():
 def eval_sec_004():
     """EVAL-SEC-004: All allowlist .regex files contain valid regex"""
     errors = []
-    allowlist_dir = REPO_ROOT / PLUGIN_DIR / "allowlists"
-    if allowlist_dir.is_dir():
-        for fpath in sorted(allowlist_dir.glob("*.regex")):
-            content = fpath.read_text(encoding="utf-8", errors="replace").strip()
+    if dir_exists(f"{PLUGIN_DIR}/allowlists"):
+        for fname in list_files(f"{PLUGIN_DIR}/allowlists", ".regex"):
+            content = read_file(f"{PLUGIN_DIR}/allowlists/{fname}").strip()
             if not content:
-                errors.append(f"{fpath.name}: empty file")
+                errors.append(f"{fname}: empty file")
                 continue
             # Combine non-comment, non-blank lines with | (same logic as validate-file-paths.py)
             lines = [
@@ -790,13 +944,13 @@ def eval_sec_004():
                 if line.strip() and not line.strip().startswith("#")
             ]
             if not lines:
-                errors.append(f"{fpath.name}: no active patterns")
+                errors.append(f"{fname}: no active patterns")
                 continue
             combined = "|".join(lines)
             try:
                 re.compile(combined)
             except re.error as e:
-                errors.append(f"{fpath.name}: invalid regex: {e}")
+                errors.append(f"{fname}: invalid regex: {e}")
     else:
         errors.append(f"{PLUGIN_DIR}/allowlists/ directory not found")
     record(
@@ -861,9 +1015,8 @@ def _extract_public_exports(content: str) -> List[str]:
     does not start with an underscore.
     """
     exports = []
-    pattern = re.compile(r"^(?:def|class)\s+([A-Za-z_][A-Za-z0-9_]*)")
     for line in content.splitlines():
-        m = pattern.match(line)
+        m = _RE_PUBLIC_EXPORT.match(line)
         if m and not m.group(1).startswith("_"):
             exports.append(m.group(1))
     return exports
@@ -872,9 +1025,8 @@ def _extract_public_exports(content: str) -> List[str]:
 def _extract_test_functions(content: str) -> List[str]:
     """Extract test method names (def test_*) from test file content."""
     funcs = []
-    pattern = re.compile(r"^\s+def\s+(test_[A-Za-z0-9_]+)")
     for line in content.splitlines():
-        m = pattern.match(line)
+        m = _RE_TEST_FUNC.match(line)
         if m:
             funcs.append(m.group(1))
     return funcs
@@ -1061,6 +1213,20 @@ ALL_EVALS = [
 ]
 
 
+# Report sections, keyed by the category token in "EVAL-<PREFIX>-NNN", in print order
+CATEGORIES = {
+    "PATH": "Path Migration",
+    "INV": "File Inventory",
+    "MAN": "Manifests",
+    "TPL": "Template Consistency",
+    "ORC": "Orchestrator Consistency",
+    "CLN": "Cleanup",
+    "DOC": "Documentation",
+    "SEC": "Security",
+    "MAINT": "Maintenance",
+}
+
+
 def main():
     start = time.time()
 
@@ -1084,47 +1250,38 @@ def main():
 
     elapsed = time.time() - start
 
-    # Group results by category
-    categories = {
-        "PATH": "Path Migration",
-        "INV": "File Inventory",
-        "MAN": "Manifests",
-        "TPL": "Template Consistency",
-        "ORC": "Orchestrator Consistency",
-        "CLN": "Cleanup",
-        "DOC": "Documentation",
-        "SEC": "Security",
-        "MAINT": "Maintenance",
-    }
-
-    passed = sum(1 for r in results if r.passed)
-    failed = sum(1 for r in results if not r.passed)
-
-    for prefix, label in categories.items():
-        group = [r for r in results if f"-{prefix}-" in r.eval_id]
+    passed = sum(r.passed for r in results)
+    failed = len(results) - passed
+
+    # Bucket results by the category token in "EVAL-<PREFIX>-NNN" in one pass
+    groups: Dict[str, List[EvalResult]] = defaultdict(list)
+    ungrouped: List[EvalResult] = []
+    for r in results:
+        parts = r.eval_id.split("-", 2)
+        if len(parts) == 3 and parts[1] in CATEGORIES:
+            groups[parts[1]].append(r)
+        else:
+            ungrouped.append(r)
+
+    # Build the report in memory and emit it with a single write
+    out: List[str] = []
+    for prefix, label in CATEGORIES.items():
+        group = groups.get(prefix)
         if group:
-            print(f"--- {label} ---")
-            for r in group:
-                print(r)
-            print()
-
-    # Ungrouped (if any)
-    grouped_ids = set()
-    for prefix in categories:
-        for r in results:
-            if f"-{prefix}-" in r.eval_id:
-                grouped_ids.add(r.eval_id)
-    ungrouped = [r for r in results if r.eval_id not in grouped_ids]
-    if ungrouped:
-        print("--- Other ---")
-        for r in ungrouped:
-            print(r)
-        print()
+            out.append(f"--- {label} ---")
+            out.extend(str(r) for r in group)
+            out.append("")
 
-    print("=" * 70)
-    print(f"Results: {passed} passed, {failed} failed, {len(results)} total")
-    print(f"Elapsed: {elapsed:.2f}s")
-    print("=" * 70)
+    if ungrouped:
+        out.append("--- Other ---")
+        out.extend(str(r) for r in ungrouped)
+        out.append("")
+
+    out.append("=" * 70)
+    out.append(f"Results: {passed} passed, {failed} failed, {len(results)} total")
+    out.append(f"Elapsed: {elapsed:.2f}s")
+    out.append("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
 
     sys.exit(0 if failed == 0 else 1)
 
@@ -2,23 +2,24 @@
 """Shared utilities for Claude Code hooks."""
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-from typing import Any
+from typing import Any, Iterator
 
-# Keys that typically contain file paths in TOOL_INPUT JSON
-PATH_KEYS = {
+# Keys that typically contain file paths in TOOL_INPUT JSON (all lowercase)
+PATH_KEYS = frozenset({
     "file_path",
     "filepath",
     "path",
     "target_file",
     "filename",
     "file",
-}
+})
 
 
 def load_patterns(file_path: str) -> re.Pattern:
@@ -26,13 +27,9 @@ def load_patterns(file_path: str) -> re.Pattern:
 
     Raises SystemExit if file has no patterns or contains invalid regex.
     """
-    patterns: list[str] = []
     with open(file_path, "r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            patterns.append(stripped)
+        lines = handle.read().splitlines()
+    patterns = [line for line in map(str.strip, lines) if line and not line.startswith("#")]
 
     if not patterns:
         print(f"pattern file has no patterns: {file_path}", file=sys.stderr)
@@ -51,53 +48,82 @@ def load_patterns(file_path: str) -> re.Pattern:
 
 
 def collect_paths(value: Any, results: list) -> None:
-    """Recursively extract file paths from a JSON structure."""
-    if isinstance(value, dict):
-        for key, item in value.items():
-            if isinstance(item, str) and key.lower() in PATH_KEYS:
-                results.append(item)
-            else:
-                collect_paths(item, results)
-    elif isinstance(value, list):
-        for item in value:
-            collect_paths(item, results)
-
-
-def normalize_path(path: str) -> list[str]:
-    """Return deduplicated path variations (tilde, symlink, relative/absolute)."""
-    candidates: list[str] = [path]
+    """Extract file paths from a JSON structure, in document order.
+
+    Walks an explicit stack instead of recursing so deeply nested input cannot
+    hit the recursion limit. Only containers and path-keyed strings are pushed;
+    other leaves (numbers, bools, unrelated strings) are dropped on sight.
+    """
+    stack: list[Any] = [value] if isinstance(value, (dict, list)) else []
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            results.append(item)
+        elif isinstance(item, dict):
+            stack.extend(
+                child for key, child in reversed(item.items())
+                if isinstance(child, (dict, list))
+                # Keys are nearly always lowercase already; skip the lower() copy then
+                or (isinstance(child, str)
+                    and (key if key.islower() else key.lower()) in PATH_KEYS)
+            )
+        else:
+            stack.extend(
+                child for child in reversed(item) if isinstance(child, (dict, list))
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def _cwd() -> str:
+    """Working directory, looked up once per process (hooks never chdir)."""
+    return os.getcwd()
+
+
+def _path_variants(path: str) -> Iterator[str]:
+    """Yield path variations, cheapest first; may repeat."""
+    yield path
 
     if path.startswith("./"):
-        candidates.append(path[2:])
+        yield path[2:]
 
     if os.path.isabs(path):
         try:
-            candidates.append(os.path.relpath(path, os.getcwd()))
+            yield os.path.relpath(path, _cwd())
         except ValueError:
             pass
-
-    if path.startswith("~"):
+    elif path.startswith("~"):
         expanded = os.path.expanduser(path)
-        candidates.append(expanded)
+        yield expanded
         try:
-            candidates.append(os.path.relpath(expanded, os.getcwd()))
+            yield os.path.relpath(expanded, _cwd())
         except ValueError:
             pass
 
+    # realpath stays unconditional: a relative path can still traverse a
+    # symlinked directory, and callers rely on the resolved form to catch it.
     try:
-        real_path = os.path.realpath(path)
-        if real_path != path:
-            candidates.append(real_path)
+        yield os.path.realpath(path)
     except OSError:
         pass
 
-    return list(dict.fromkeys(candidates))
+
+def normalize_path(path: str) -> Iterator[str]:
+    """Yield deduplicated path variations (tilde, symlink, relative/absolute).
+
+    Lazy, so a caller that stops at the first matching variant skips the
+    syscall-backed ones (relpath, realpath) after it.
+    """
+    seen: set[str] = set()
+    for candidate in _path_variants(path):
+        if candidate not in seen:
+            seen.add(candidate)
+            yield candidate
 
 
 def block_response(reason: str) -> None:
     """Print a JSON block response to stdout and exit with code 2."""
-    response = {"decision": "block", "reason": reason}
-    print(json.dumps(response))
+    # Only the reason needs escaping; same output as dumping the whole dict
+    print('{"decision": "block", "reason": ' + json.dumps(reason) + "}")
     sys.exit(2)
 
 
@@ -155,3 +181,18 @@ def run_subprocess(
         return (-1, "", f"Command not found: {args[0] if args else 'empty'}")
     except OSError as exc:
         return (-1, "", f"OS error: {exc}")
+
+
+def spawn_detached(args: list) -> bool:
+    """Start a subprocess without waiting for it (output discarded). Returns False on failure."""
+    try:
+        subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return True
+    except OSError:
+        return False
@@ -12,38 +12,38 @@ from _hook_utils import (
     log_info,
     log_warn,
     run_subprocess,
+    spawn_detached,
 )
 
 HOOK_NAME = "auto-formatter"
 
+# Opt-in: start the formatter and return without waiting for it
+ASYNC_ENV_VAR = "SYSTEM2_FORMAT_ASYNC"
+
 # Map file extensions to formatters
 # Format: extension -> (formatter_name, command_args)
 # command_args should NOT include the file path; it will be appended
-FORMATTER_MAP: dict[str, tuple[str, list[str]]] = {
-    ".js": ("prettier", ["prettier", "--write"]),
-    ".jsx": ("prettier", ["prettier", "--write"]),
-    ".ts": ("prettier", ["prettier", "--write"]),
-    ".tsx": ("prettier", ["prettier", "--write"]),
-    ".json": ("prettier", ["prettier", "--write"]),
-    ".md": ("prettier", ["prettier", "--write"]),
-    ".css": ("prettier", ["prettier", "--write"]),
-    ".html": ("prettier", ["prettier", "--write"]),
-    ".py": ("black", ["black"]),
-    ".go": ("gofmt", ["gofmt", "-w"]),
+FORMATTER_MAP: dict[str, tuple[str, tuple[str, ...]]] = {
+    ".js": ("prettier", ("prettier", "--write")),
+    ".jsx": ("prettier", ("prettier", "--write")),
+    ".ts": ("prettier", ("prettier", "--write")),
+    ".tsx": ("prettier", ("prettier", "--write")),
+    ".json": ("prettier", ("prettier", "--write")),
+    ".md": ("prettier", ("prettier", "--write")),
+    ".css": ("prettier", ("prettier", "--write")),
+    ".html": ("prettier", ("prettier", "--write")),
+    ".py": ("black", ("black",)),
+    ".go": ("gofmt", ("gofmt", "-w")),
 }
 
 
 def get_formatter_for_file(file_path: str) -> tuple[str, list[str]] | None:
-    _, ext = os.path.splitext(file_path)
-    ext_lower = ext.lower()
-
-    if ext_lower not in FORMATTER_MAP:
+    entry = FORMATTER_MAP.get(os.path.splitext(file_path)[1].lower())
+    if entry is None:
         return None
 
-    formatter_name, base_args = FORMATTER_MAP[ext_lower]
-    # Append the file path to the command arguments
-    command_args = base_args + [file_path]
-    return (formatter_name, command_args)
+    formatter_name, base_args = entry
+    return (formatter_name, [*base_args, file_path])
 
 
 def main() -> None:
@@ -70,6 +70,13 @@ def main() -> None:
         log_warn(HOOK_NAME, f"{formatter_name} not found in PATH, skipping formatting for {file_path}")
         sys.exit(0)
 
+    if os.environ.get(ASYNC_ENV_VAR) == "1":
+        if spawn_detached(command_args):
+            log_info(HOOK_NAME, f"Started {formatter_name} on {file_path} in background")
+        else:
+            log_warn(HOOK_NAME, f"Failed to start {formatter_name} for {file_path}")
+        sys.exit(0)
+
     log_info(HOOK_NAME, f"Running {formatter_name} on {file_path}")
 
     returncode, stdout, stderr = run_subprocess(command_args)
@@ -23,59 +23,27 @@ HOOK_NAME = "dangerous-command-blocker"
 # Security note: Patterns cover short flags (-rf), long flags (--recursive --force),
 # and separated flags (-r -f) to prevent bypass attempts.
 
-# Helper regex for matching rm with recursive+force flags in various forms:
-# - Short combined: -rf, -fr, -rfi, etc.
-# - Short separated: -r -f, -f -r, -r ... -f
-# - Long flags: --recursive --force, --force --recursive
-# - Mixed: -r --force, --recursive -f
-_RM_RF_FLAGS = (
-    r'('
-    r'-[a-zA-Z]*r[a-zA-Z]*f[a-zA-Z]*|'  # -rf, -rfi, -fir, etc.
-    r'-[a-zA-Z]*f[a-zA-Z]*r[a-zA-Z]*|'  # -fr, -fri, etc.
-    r'-r\s+-f|-f\s+-r|'  # -r -f, -f -r (separated)
-    r'-[a-zA-Z]*r[a-zA-Z]*\s+-[a-zA-Z]*f[a-zA-Z]*|'  # -ri -f etc.
-    r'-[a-zA-Z]*f[a-zA-Z]*\s+-[a-zA-Z]*r[a-zA-Z]*|'  # -fi -r etc.
-    r'--recursive\s+--force|--force\s+--recursive|'  # long flags
-    r'--recursive\s+-f|-f\s+--recursive|'  # mixed
-    r'-r\s+--force|--force\s+-r|'  # mixed
-    r'--recursive[^|;&]*-f|-f[^|;&]*--recursive|'  # long + short anywhere
-    r'-r[^|;&]*--force|--force[^|;&]*-r'  # short + long anywhere
-    r')'
-)
+# rm (optionally under sudo) and its arguments up to the next shell operator
+# or quote. The arguments are a single character class, so matching stays
+# linear; the recursive/force flags are then read token by token in
+# check_rm_rf, which covers short (-rf, -fR, -r -f), long (--recursive --force)
+# and mixed forms in any order without a backtracking alternation.
+RM_INVOCATION_PATTERN = re.compile(r"""\b(sudo\s+)?rm\s+([^;|&()`\n'"]*)""")
+ARG_TOKEN_PATTERN = re.compile(r'\S+')
+
+# rm -rf targets that are always blocked: (target, human_readable_reason)
+RM_RF_TARGET_REASONS = {
+    "/": "rm -rf targeting root filesystem (/) is extremely dangerous",
+    "/*": "rm -rf targeting root filesystem (/) is extremely dangerous",
+    ".": "rm -rf targeting current directory (.) could delete critical files",
+    "./": "rm -rf targeting current directory (.) could delete critical files",
+    "..": "rm -rf targeting parent directory (..) could delete critical files",
+    "../": "rm -rf targeting parent directory (..) could delete critical files",
+}
+# sudo rm -rf (any path) - elevated privilege is always dangerous
+RM_RF_SUDO_REASON = "sudo rm -rf with elevated privileges is extremely dangerous"
 
 DANGER_PATTERNS: list[Tuple[re.Pattern, str]] = [
-    # rm -rf with root path (/, /*)
-    (
-        re.compile(
-            r'\brm\s+' + _RM_RF_FLAGS + r'\s*(/|/\*)\s*($|;|\||&)',
-            re.MULTILINE,
-        ),
-        "rm -rf targeting root filesystem (/) is extremely dangerous",
-    ),
-    # rm -rf with current directory (. or ./)
-    (
-        re.compile(
-            r'\brm\s+' + _RM_RF_FLAGS + r'\s*\./?(?:\s|$|;|\||&)',
-            re.MULTILINE,
-        ),
-        "rm -rf targeting current directory (.) could delete critical files",
-    ),
-    # rm -rf with parent directory (.. or ../)
-    (
-        re.compile(
-            r'\brm\s+' + _RM_RF_FLAGS + r'\s*\.\./?(?:\s|$|;|\||&)',
-            re.MULTILINE,
-        ),
-        "rm -rf targeting parent directory (..) could delete critical files",
-    ),
-    # sudo rm -rf (any path) - elevated privilege is always dangerous
-    (
-        re.compile(
-            r'\bsudo\s+rm\s+' + _RM_RF_FLAGS + r'\s+',
-            re.MULTILINE,
-        ),
-        "sudo rm -rf with elevated privileges is extremely dangerous",
-    ),
     # chmod 777 (any path) - world-writable and executable
     (
         re.compile(r'\bchmod\s+(.*\s+)?777\s+', re.MULTILINE),
@@ -132,15 +100,47 @@ DANGER_PATTERNS: list[Tuple[re.Pattern, str]] = [
     ),
 ]
 
+# All DANGER_PATTERNS as one alternation so a command is scanned once. Group
+# d<i> identifies the pattern; case-insensitive entries keep that via (?i:...).
+DANGER_COMBINED = re.compile(
+    "|".join(
+        f"(?P<d{i}>(?i:{pattern.pattern}))" if pattern.flags & re.IGNORECASE
+        else f"(?P<d{i}>{pattern.pattern})"
+        for i, (pattern, _) in enumerate(DANGER_PATTERNS)
+    ),
+    re.MULTILINE,
+)
+DANGER_REASONS = [reason for _, reason in DANGER_PATTERNS]
+
+# Every DANGER_PATTERNS entry (and check_rm_rf) needs one of these words (lowercased) to match,
+# so commands containing none of them skip the regex scan entirely.
+# Keep in sync when adding patterns.
+TRIGGER_TOKENS = ("rm", "sudo", "chmod", "git", "drop", "delete")
+
 # Pattern to identify echo/printf statements
 ECHO_PRINT_PATTERN = re.compile(r'^[\s]*(echo|printf)\s+', re.MULTILINE)
 
+# Pattern to match echo/printf at the end of the text before a quoted string
+ECHO_PRINT_SUFFIX_PATTERN = re.compile(r'(echo|printf)\s*$')
+
+# Pattern to match the text before a quoted string that is a search pattern or
+# commit message rather than shell code: the quote belongs to a grep-style
+# command word in the same segment, or directly follows -m / --message
+DATA_ARGUMENT_PREFIX_PATTERN = re.compile(
+    r'(?:(?:^|[;&|(])\s*(?:git\s+grep|[ef]?grep|rg|ag|ack)\s[^;&|]*'
+    r'|\s(?:-[a-zA-Z]*m|--message=?))\s*$'
+)
+
 # Pattern to match quoted strings (single or double quotes)
 QUOTED_STRING_PATTERN = re.compile(r'''(["'])(?:(?!\1)[^\\]|\\.)*\1''')
 
 
 def is_echo_or_print_only(command: str, match_span: Tuple[int, int]) -> bool:
     """Return True if the match is inside a quoted string following echo/printf."""
+    # No quote characters means no quoted region can contain the match
+    if "'" not in command and '"' not in command:
+        return False
+
     match_start, match_end = match_span
 
     # Find all quoted strings in the command
@@ -167,20 +167,84 @@ def is_echo_or_print_only(command: str, match_span: Tuple[int, int]) -> bool:
             # Check if the prefix ends with echo/printf pattern
             # Strip trailing whitespace and check
             prefix_stripped = prefix.rstrip()
-            if re.search(r'(echo|printf)\s*$', prefix_stripped):
+            if ECHO_PRINT_SUFFIX_PATTERN.search(prefix_stripped):
                 return True
     return False
 
 
+def is_quoted_data_argument(command: str, match_span: Tuple[int, int]) -> bool:
+    """Return True if the match is inside a quoted grep pattern or commit message."""
+    if "'" not in command and '"' not in command:
+        return False
+
+    match_start, match_end = match_span
+    for quoted_match in QUOTED_STRING_PATTERN.finditer(command):
+        q_start, q_end = quoted_match.span()
+        if q_start <= match_start and match_end <= q_end:
+            return bool(DATA_ARGUMENT_PREFIX_PATTERN.search(command, 0, q_start))
+    return False
+
+
+def check_rm_rf(command: str) -> Tuple[bool, str]:
+    """Check rm invocations for recursive+force deletion of /, . or .. (any path under sudo).
+
+    Quoted rm text is still checked (bash -c "...", eval, ssh host '...'),
+    unless it is only echoed or is a grep pattern or commit message.
+    """
+    for invocation in RM_INVOCATION_PATTERN.finditer(command):
+        span = invocation.span()
+        if is_echo_or_print_only(command, span) or is_quoted_data_argument(command, span):
+            continue
+
+        recursive = force = options_done = False
+        target_reason = ""
+        has_path = False
+        for token in ARG_TOKEN_PATTERN.finditer(invocation.group(2)):
+            arg = token.group()
+            if not options_done and arg.startswith("-") and arg != "-":
+                if arg == "--":
+                    options_done = True
+                elif arg.startswith("--"):
+                    recursive = recursive or arg == "--recursive"
+                    force = force or arg == "--force"
+                else:
+                    recursive = recursive or "r" in arg or "R" in arg
+                    force = force or "f" in arg
+                continue
+            has_path = True
+            if not target_reason:
+                target_reason = RM_RF_TARGET_REASONS.get(arg, "")
+
+        if not (recursive and force):
+            continue
+        if target_reason:
+            return (True, target_reason)
+        # The capture stops at a quote; a quoted argument still counts as a path
+        quoted_path = command[invocation.end():invocation.end() + 1] in ("'", '"')
+        if invocation.group(1) and (has_path or quoted_path):
+            return (True, RM_RF_SUDO_REASON)
+    return (False, "")
+
+
 def check_dangerous_pattern(command: str) -> Tuple[bool, str]:
     """Check if a command matches any dangerous patterns."""
-    for pattern, reason in DANGER_PATTERNS:
-        match = pattern.search(command)
-        if match:
-            if not is_echo_or_print_only(command, match.span()):
-                return (True, reason)
+    lowered = command.lower()
+    if not any(token in lowered for token in TRIGGER_TOKENS):
+        return (False, "")
 
-    return (False, "")
+    is_dangerous, reason = check_rm_rf(command)
+    if is_dangerous:
+        return (True, reason)
+
+    pos = 0
+    while True:
+        match = DANGER_COMBINED.search(command, pos)
+        if match is None:
+            return (False, "")
+        if not is_echo_or_print_only(command, match.span()):
+            return (True, DANGER_REASONS[int(match.lastgroup[1:])])
+        # Echoed text: keep looking for a real occurrence further on
+        pos = match.start() + 1
 
 
 def main() -> None:
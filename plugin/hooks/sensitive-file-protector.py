@@ -23,17 +23,18 @@ HOOK_NAME = "sensitive-file-protector"
 
 # Default sensitive file patterns with descriptions
 # Each tuple: (pattern, description)
+# Patterns expect "/" separators; check_sensitive_path maps "\\" to "/" first.
 SENSITIVE_PATTERNS: list[Tuple[re.Pattern, str]] = [
     # Environment files
-    (re.compile(r"(^|/|\\)\.env$"), "Environment file (.env)"),
-    (re.compile(r"(^|/|\\)\.env\.[a-zA-Z0-9_-]+$"), "Environment file (.env.*)"),
+    (re.compile(r"(?:^|/)\.env$"), "Environment file (.env)"),
+    (re.compile(r"(?:^|/)\.env\.[a-zA-Z0-9_-]+$"), "Environment file (.env.*)"),
 
     # SSH directory and keys
-    (re.compile(r"(^|/|\\)\.ssh(/|\\|$)"), "SSH directory (~/.ssh/)"),
+    (re.compile(r"(?:^|/)\.ssh(?:/|$)"), "SSH directory (~/.ssh/)"),
 
     # Cloud credentials directories
-    (re.compile(r"(^|/|\\)\.aws(/|\\|$)"), "AWS credentials directory (~/.aws/)"),
-    (re.compile(r"(^|/|\\)\.gnupg(/|\\|$)"), "GPG directory (~/.gnupg/)"),
+    (re.compile(r"(?:^|/)\.aws(?:/|$)"), "AWS credentials directory (~/.aws/)"),
+    (re.compile(r"(?:^|/)\.gnupg(?:/|$)"), "GPG directory (~/.gnupg/)"),
 
     # Generic credential/secrets files (case-insensitive)
     (re.compile(r"credentials", re.IGNORECASE), "File containing 'credentials'"),
@@ -44,16 +45,27 @@ SENSITIVE_PATTERNS: list[Tuple[re.Pattern, str]] = [
     (re.compile(r"\.key$", re.IGNORECASE), "Key file (*.key)"),
 
     # SSH private key filenames
-    (re.compile(r"(^|/|\\)id_rsa$"), "RSA private key (id_rsa)"),
-    (re.compile(r"(^|/|\\)id_ed25519$"), "Ed25519 private key (id_ed25519)"),
-    (re.compile(r"(^|/|\\)id_ecdsa$"), "ECDSA private key (id_ecdsa)"),
+    (re.compile(r"(?:^|/)id_rsa$"), "RSA private key (id_rsa)"),
+    (re.compile(r"(?:^|/)id_ed25519$"), "Ed25519 private key (id_ed25519)"),
+    (re.compile(r"(?:^|/)id_ecdsa$"), "ECDSA private key (id_ecdsa)"),
 
     # Auth config files
-    (re.compile(r"(^|/|\\)\.netrc$"), "Netrc credentials file (.netrc)"),
-    (re.compile(r"(^|/|\\)\.npmrc$"), "NPM config file (.npmrc) - may contain tokens"),
-    (re.compile(r"(^|/|\\)\.pypirc$"), "PyPI config file (.pypirc) - may contain tokens"),
+    (re.compile(r"(?:^|/)\.netrc$"), "Netrc credentials file (.netrc)"),
+    (re.compile(r"(?:^|/)\.npmrc$"), "NPM config file (.npmrc) - may contain tokens"),
+    (re.compile(r"(?:^|/)\.pypirc$"), "PyPI config file (.pypirc) - may contain tokens"),
 ]
 
+# All SENSITIVE_PATTERNS as one alternation so a path is scanned once. Group
+# s<i> identifies the pattern; case-insensitive entries keep that via (?i:...).
+SENSITIVE_COMBINED = re.compile(
+    "|".join(
+        f"(?P<s{i}>(?i:{pattern.pattern}))" if pattern.flags & re.IGNORECASE
+        else f"(?P<s{i}>{pattern.pattern})"
+        for i, (pattern, _) in enumerate(SENSITIVE_PATTERNS)
+    )
+)
+SENSITIVE_DESCRIPTIONS = [description for _, description in SENSITIVE_PATTERNS]
+
 
 def extract_paths_from_bash_command(command: str) -> list[str]:
     """Extract potential file paths from a Bash command string via shlex."""
@@ -83,10 +95,7 @@ def extract_paths_from_bash_command(command: str) -> list[str]:
             paths.append(token)
         # Also check for bare filenames that might be sensitive
         # e.g., "cat id_rsa" or "vim credentials.json"
-        elif any(
-            pattern.search(token)
-            for pattern, _ in SENSITIVE_PATTERNS
-        ):
+        elif SENSITIVE_COMBINED.search(token):
             paths.append(token)
 
     return paths
@@ -95,16 +104,26 @@ def extract_paths_from_bash_command(command: str) -> list[str]:
 def check_sensitive_path(
     path: str,
     additional_patterns: list[Tuple[re.Pattern, str]] | None = None,
+    checked: set[str] | None = None,
 ) -> Tuple[bool, str]:
-    """Check if a path matches any built-in or additional sensitive pattern."""
-    candidates = normalize_path(path)
+    """Check if a path matches any built-in or additional sensitive pattern.
 
-    all_patterns = list(SENSITIVE_PATTERNS)
-    if additional_patterns:
-        all_patterns.extend(additional_patterns)
+    Candidates already in ``checked`` (cleared by an earlier call) are skipped,
+    and newly cleared candidates are added to it.
+    """
+    candidates = normalize_path(path)
 
     for candidate in candidates:
-        for pattern, description in all_patterns:
+        if checked is not None:
+            if candidate in checked:
+                continue
+            checked.add(candidate)
+        match = SENSITIVE_COMBINED.search(candidate.replace("\\", "/"))
+        if match:
+            return (True, SENSITIVE_DESCRIPTIONS[int(match.lastgroup[1:])])
+        # User patterns are checked one by one: joining them could change their
+        # meaning (global inline flags, numbered backreferences).
+        for pattern, description in additional_patterns or ():
             if pattern.search(candidate):
                 return (True, description)
 
@@ -114,18 +133,19 @@ def check_sensitive_path(
 def load_additional_patterns(file_path: str) -> list[Tuple[re.Pattern, str]] | None:
     """Load additional sensitive patterns from a file. Returns None on failure."""
     try:
-        patterns: list[Tuple[re.Pattern, str]] = []
         with open(file_path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                try:
-                    compiled = re.compile(stripped)
-                    patterns.append((compiled, f"Custom pattern: {stripped}"))
-                except re.error as exc:
-                    log_warn(HOOK_NAME, f"Invalid regex in patterns file: {stripped} ({exc})")
-                    continue
+            lines = handle.read().splitlines()
+
+        patterns: list[Tuple[re.Pattern, str]] = []
+        for stripped in map(str.strip, lines):
+            if not stripped or stripped.startswith("#"):
+                continue
+            try:
+                compiled = re.compile(stripped)
+                patterns.append((compiled, f"Custom pattern: {stripped}"))
+            except re.error as exc:
+                log_warn(HOOK_NAME, f"Invalid regex in patterns file: {stripped} ({exc})")
+                continue
 
         if patterns:
             return patterns
@@ -196,9 +216,11 @@ def main() -> int:
         # No paths to check, allow the operation
         return 0
 
-    # Check each path against sensitive patterns
+    # Check each path against sensitive patterns; variants shared between
+    # paths (e.g. "./.env" and ".env") are only matched once
+    checked: set[str] = set()
     for path in paths_to_check:
-        is_sensitive, reason = check_sensitive_path(path, additional_patterns)
+        is_sensitive, reason = check_sensitive_path(path, additional_patterns, checked)
         if is_sensitive:
             log_warn(HOOK_NAME, f"Blocked access to sensitive path: {path}")
             block_response(
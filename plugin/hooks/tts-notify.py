@@ -2,15 +2,32 @@
 """TTS notification hook — announces task completion audibly."""
 from __future__ import annotations
 
-import subprocess
+import shutil
 import sys
 
+from _hook_utils import spawn_detached
+
 # Message mapping for hook types
 MESSAGES = {
     "stop": "Task complete",
     "subagent": "Subagent complete",
 }
 
+# Linux TTS engines, in order of preference
+LINUX_TTS_COMMANDS = ("espeak", "spd-say")
+
+# PowerShell accepts the typographic single quotes as string delimiters too;
+# each is escaped inside a '...' literal by doubling it
+POWERSHELL_QUOTE_ESCAPES = str.maketrans(
+    {quote: quote * 2 for quote in "'\u2018\u2019\u201a\u201b"}
+)
+
+# Windows PowerShell script; {message} must be escaped with POWERSHELL_QUOTE_ESCAPES
+WINDOWS_TTS_SCRIPT = (
+    "Add-Type -AssemblyName System.Speech; "
+    "(New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak('{message}')"
+)
+
 
 def get_tts_command(message: str) -> list[str] | None:
     platform = sys.platform
@@ -21,23 +38,17 @@ def get_tts_command(message: str) -> list[str] | None:
 
     elif platform == "win32":
         # Windows: use PowerShell with SpeechSynthesizer
-        escaped = message.replace("'", "''")
-        ps_script = (
-            f"Add-Type -AssemblyName System.Speech; "
-            f"(New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak('{escaped}')"
-        )
-        return ["powershell", "-Command", ps_script]
+        escaped = message.translate(POWERSHELL_QUOTE_ESCAPES)
+        return ["powershell", "-Command", WINDOWS_TTS_SCRIPT.format(message=escaped)]
 
     elif platform.startswith("linux"):
-        # Linux: check for espeak or spd-say
-        import shutil
-
-        if shutil.which("espeak"):
-            return ["espeak", message]
-        elif shutil.which("spd-say"):
-            return ["spd-say", message]
-        else:
-            return None
+        # Linux: first of espeak / spd-say on PATH. The resolved path is used
+        # so the spawn does not search PATH a second time.
+        for name in LINUX_TTS_COMMANDS:
+            resolved = shutil.which(name)
+            if resolved:
+                return [resolved, message]
+        return None
 
     else:
         # Unsupported platform
@@ -50,11 +61,8 @@ def speak(message: str) -> None:
         if tts_command is None:
             return
 
-        subprocess.run(
-            tts_command,
-            timeout=10,
-            capture_output=True,
-        )
+        # Fire and forget: the hook exits while speech plays on
+        spawn_detached(tts_command)
     except Exception:
         # Silently ignore all failures
         pass